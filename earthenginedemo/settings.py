@@ -44,6 +44,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.http.ConditionalGetMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -83,6 +84,48 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# Used for Earth Engine dataset metadata. Point this at a shared backend
+# (e.g. Redis or Memcached) when running several worker processes.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "geedownloader",
+    }
+}
+
+
+# Earth Engine
+# Endpoint used by every ee.Initialize call. The high-volume endpoint has
+# higher request quotas for the many small metadata and status calls.
+
+GEE_ENDPOINT = os.environ.get(
+    "GEE_ENDPOINT", "https://earthengine-highvolume.googleapis.com")
+
+
+# Logging
+# https://docs.djangoproject.com/en/5.1/topics/logging/
+# The app's debug output is dropped unless GEEDOWNLOADER_LOG_LEVEL=DEBUG.
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+        },
+    },
+    "loggers": {
+        "geedownloader": {
+            "handlers": ["console"],
+            "level": os.environ.get("GEEDOWNLOADER_LOG_LEVEL", "INFO"),
+        },
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -1,6 +1,10 @@
 import ee
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from .services import GEEService, PERMISSION_ERROR_RE
+
+# Number of export tasks submitted to Earth Engine at the same time
+EXPORT_SUBMIT_WORKERS = 4
 
 
 def download_ee_to_drive(
@@ -44,11 +48,11 @@ def download_ee_to_drive(
     # Initialize Earth Engine with project if specified
     if project_name:
         try:
-            ee.Initialize(project=project_name)
+            GEEService.ensure_initialized(project_name)
             print(f"Initialized Earth Engine with project: {project_name}")
         except Exception as e:
             error_msg = str(e)
-            if "Permission denied" in error_msg or "not found" in error_msg or "does not have required permission" in error_msg:
+            if PERMISSION_ERROR_RE.search(error_msg):
                 print(
                     f"Permission error: Caller does not have required permission to use project {project_name}. Please check your project ID.")
                 raise ValueError(
@@ -76,19 +80,32 @@ def download_ee_to_drive(
     # Get collection
     collection = ee.ImageCollection(collection_name)
 
-    # Print available dates to debug
-    first_date = ee.Date(collection.first().get(
-        'system:time_start')).format('YYYY-MM-dd').getInfo()
-    last_date = ee.Date(collection.sort('system:time_start', False).first().get(
-        'system:time_start')).format('YYYY-MM-dd').getInfo()
+    # Fetch the collection's time range and the days of the requested range
+    # that have an image in one request, instead of probing every day
+    end_exclusive = (end_dt + timedelta(days=1)).strftime('%Y-%m-%d')
+    availability = ee.Dictionary({
+        'first_date': ee.Date(collection.first().get(
+            'system:time_start')).format('YYYY-MM-dd'),
+        'last_date': ee.Date(collection.sort('system:time_start', False).first().get(
+            'system:time_start')).format('YYYY-MM-dd'),
+        'image_dates': collection.filterDate(start_date, end_exclusive)
+        .aggregate_array('system:time_start')
+        .map(lambda t: ee.Date(t).format('YYYY-MM-dd'))
+    }).getInfo()
     print(
-        f"Collection {collection_name} available from {first_date} to {last_date}")
+        f"Collection {collection_name} available from {availability['first_date']} to {availability['last_date']}")
+    image_dates = set(availability['image_dates'])
 
-    task_ids = []
+    exports = []
     no_data_dates = []
     for date in date_list:
         print(f"Processing date: {date}")
 
+        if date not in image_dates:
+            no_data_dates.append(date)
+            print(f"No data available for {date}, skipping...")
+            continue
+
         try:
             # Create date objects for filtering
             start_date_ee = ee.Date(date)
@@ -98,13 +115,6 @@ def download_ee_to_drive(
             image = collection.filterDate(
                 start_date_ee, end_date_ee).select(band_name).first()
 
-            # Check if image exists
-            image_info = image.getInfo()
-            if image_info is None:
-                no_data_dates.append(date)
-                print(f"No data available for {date}, skipping...")
-                continue
-
             # If temperature data and conversion requested, convert from Kelvin to Celsius
             output_band_name = band_name
             if convert_kelvin:
@@ -126,17 +136,27 @@ def download_ee_to_drive(
                 maxPixels=1e9,
                 fileFormat='GeoTIFF'
             )
+            exports.append((date, export_filename, task))
 
-            task.start()
-            task_ids.append(task.id)
-            print(
-                f"Started export task for {date} to folder '{folder_name}' as '{export_filename}'")
-
-            # Pause briefly to avoid hitting API limits
-            time.sleep(1)
+        except Exception as e:
+            print(f"Error processing {date}: {str(e)}")
 
+    def start_export(export):
+        date, export_filename, task = export
+        try:
+            task.start()
         except Exception as e:
             print(f"Error processing {date}: {str(e)}")
+            return None
+        print(
+            f"Started export task for {date} to folder '{folder_name}' as '{export_filename}'")
+        return task.id
+
+    # Submitting a task is a network round trip; a small pool overlaps them
+    # while keeping the request rate within the API limits
+    with ThreadPoolExecutor(max_workers=EXPORT_SUBMIT_WORKERS) as executor:
+        task_ids = [task_id for task_id in executor.map(start_export, exports)
+                    if task_id is not None]
 
     print(
         f"All export tasks started. Check your Google Drive folder '{folder_name}'.")
@@ -1,6 +1,6 @@
 from django.core.management.base import BaseCommand
-import requests
 from geedownloader.models import DatasetMetadata, DatasetBand, DatasetTag
+from geedownloader.services import get_http_session
 from datetime import datetime
 import json
 
@@ -13,7 +13,7 @@ class Command(BaseCommand):
         self.stdout.write(f"Fetching catalog from {catalog_url}...")
 
         try:
-            response = requests.get(catalog_url)
+            response = get_http_session().get(catalog_url)
             response.raise_for_status()
             catalog_data = response.json()
         except Exception as e:
@@ -0,0 +1,40 @@
+# PostgreSQL only: the operations do nothing on SQLite and other backends.
+
+from django.db import migrations
+
+# Django compiles icontains to UPPER(column::text) LIKE UPPER(...) on
+# PostgreSQL, so the trigram indexes are built on that same expression.
+TRIGRAM_INDEXES = {
+    'geedownloader_dm_id_trgm': 'id',
+    'geedownloader_dm_title_trgm': 'title',
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} '
+            f'ON geedownloader_datasetmetadata '
+            f'USING gin ((UPPER({column}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("geedownloader", "0002_datasetmetadata_asset_url_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
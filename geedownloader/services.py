@@ -1,73 +1,433 @@
 import ee
-import geojson
-from typing import Dict, List, Optional, Any
-from datetime import datetime
-import subprocess
-import json
-import os
-from pathlib import Path
+import hashlib
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple, Any, Union
+from datetime import datetime, timedelta
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from django.conf import settings
+from django.core.cache import cache
 from django.http import HttpRequest
-from .models import DatasetMetadata, DatasetBand
-import requests
-from django.db.models import Q
+from . import jsonutils
+from .models import DatasetMetadata, DatasetBand, DatasetTag
+from django.db.models import Count, Prefetch, Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+HIGH_VOLUME_URL = 'https://earthengine-highvolume.googleapis.com'
+# Endpoint passed to every ee.Initialize call
+GEE_ENDPOINT = getattr(settings, 'GEE_ENDPOINT', HIGH_VOLUME_URL)
+BATCH_POOL_SIZE = 25
+ACCESS_CHECK_POOL_SIZE = 16
+EXPORT_QUERY_POOL_SIZE = 8
+
+# Bump when the shape of cached results changes
+CACHE_SCHEMA_VERSION = 1
+METADATA_CACHE_TIMEOUT = 60 * 60 * 24
+ACTIVE_DATASET_CACHE_TIMEOUT = 60 * 60
+TEMPORAL_ACTIVE_WINDOW = timedelta(days=30)
+TASK_LIST_CACHE_TIMEOUT = 3
+SEARCH_CACHE_TIMEOUT = 60 * 10
+TAG_INDEX_TIMEOUT = 60
+# Seconds an unfinished sign-in may wait for its OAuth redirect
+AUTH_FLOW_TIMEOUT = 60 * 5
+
+# Matches Earth Engine errors caused by a wrong or inaccessible project
+PERMISSION_ERROR_RE = re.compile(
+    r'permission denied|not found|does not have required permission', re.I)
+# Matches Earth Engine errors caused by missing or expired credentials
+CREDENTIAL_ERROR_RE = re.compile(
+    r'authenticate|not authorized|credentials|invalid_grant', re.I)
+
+# Validation failures of an export request; error_code lets callers tell
+# them apart from Earth Engine errors
+DATE_RANGE_INVALID_ERROR = {
+    'error': 'Selected date range is not available for this dataset',
+    'error_code': 'date_range_invalid'
+}
+VARIABLE_INVALID_ERROR = {
+    'error': 'Selected variable is not available for this dataset',
+    'error_code': 'variable_invalid'
+}
+
+# Operation states of the v1 API mapped to the legacy task states
+OPERATION_STATES = {
+    'PENDING': 'READY',
+    'RUNNING': 'RUNNING',
+    'CANCELLING': 'CANCEL_REQUESTED',
+    'SUCCEEDED': 'COMPLETED',
+    'CANCELLED': 'CANCELLED',
+    'FAILED': 'FAILED',
+}
+
+# Process running the pending interactive OAuth flow, None when idle
+_auth_flow = {'process': None}
+_auth_flow_lock = threading.Lock()
+
+# Runs export collection queries alongside the access check
+_export_query_executor = ThreadPoolExecutor(max_workers=EXPORT_QUERY_POOL_SIZE)
+
+# In-process copy of all tag names for prefix suggestions, as parallel
+# lists of casefolded keys and names sorted by key
+_tag_index = {'keys': None, 'names': None, 'loaded_at': 0.0}
+_tag_index_lock = threading.Lock()
+
+
+def _get_tag_index() -> Tuple[List[str], List[str]]:
+    """Return the sorted tag index, reloading it once it is stale
+
+    Saves and deletes in this process clear the index right away; the
+    TTL picks up changes made elsewhere, such as by load_gee_catalog.
+    """
+    with _tag_index_lock:
+        if (_tag_index['keys'] is None
+                or time.monotonic() - _tag_index['loaded_at'] > TAG_INDEX_TIMEOUT):
+            entries = sorted(
+                (name.casefold(), name)
+                for name in DatasetTag.objects.values_list('name', flat=True).iterator()
+            )
+            _tag_index['keys'] = [key for key, _ in entries]
+            _tag_index['names'] = [name for _, name in entries]
+            _tag_index['loaded_at'] = time.monotonic()
+        return _tag_index['keys'], _tag_index['names']
+
+
+@receiver(post_save, sender=DatasetTag)
+@receiver(post_delete, sender=DatasetTag)
+def _invalidate_tag_index(**kwargs) -> None:
+    """Drop the tag index when a tag changes"""
+    with _tag_index_lock:
+        _tag_index['keys'] = None
+
+
+def _init_batch_worker() -> None:
+    """Drop the state a batch worker process inherits from its parent"""
+    global _export_query_executor
+    GEEService.reset_initialization()
+    # The parent's executor threads do not exist in the forked child
+    _export_query_executor = ThreadPoolExecutor(
+        max_workers=EXPORT_QUERY_POOL_SIZE)
+
+
+def _batch_export_worker(index: int, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one export of a start_download_batch call inside a pool worker"""
+    try:
+        GEEService.ensure_initialized(
+            request.get('project_name') or 'ee-thrcle421')
+        result = GEEService._export_one(**request)
+    except Exception as e:
+        result = {'error': str(e)}
+
+    if result.get('error'):
+        logger.warning("Batch export %s failed: %s", index, result['error'])
+    return result
+
+
+def _operation_to_task(operation: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a v1 API operation into the legacy getTaskList task shape"""
+    metadata = operation.get('metadata', {})
+    state = metadata.get('state', 'UNKNOWN')
+    task = {
+        'id': operation.get('name', '').rsplit('/', 1)[-1],
+        'state': OPERATION_STATES.get(state, state),
+        'progress': metadata.get('progress', 0) or 0
+    }
+    if operation.get('error'):
+        task['error_message'] = operation['error'].get('message')
+    return task
+
+
+def _task_list_cache_key(project_name: str = None) -> str:
+    """Return the cache key of a project's task list"""
+    return f"gee:tasks:{project_name or 'ee-thrcle421'}"
+
+
+def _get_all_tasks(project_name: str = None) -> Dict[str, Dict[str, Any]]:
+    """Return the project's tasks indexed by ID
+
+    The list is cached briefly so that several status polls arriving at
+    the same time share one getTaskList request. Starting an export drops
+    the cached list so the new task is visible to the next poll.
+    """
+    cache_key = _task_list_cache_key(project_name)
+    tasks = cache.get(cache_key)
+    if tasks is None:
+        tasks = {
+            str(task['id']): task
+            for task in ee.data.getTaskList()
+            if isinstance(task, dict) and 'id' in task
+        }
+        cache.set(cache_key, tasks, TASK_LIST_CACHE_TIMEOUT)
+    return tasks
+
+
+def _task_to_status(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the status response for a task in the getTaskList shape"""
+    state = task.get('state', 'UNKNOWN')
+
+    # Calculate progress based on state
+    if state == 'COMPLETED':
+        progress = 100
+    elif state == 'FAILED' or state == 'CANCELLED':
+        progress = 0
+    else:
+        # For READY, RUNNING, etc. states
+        progress = task.get('progress', 0)
+        if progress is None:
+            progress = 0
+        elif isinstance(progress, float):
+            # Convert from fraction to percentage
+            progress = int(progress * 100)
+
+    return {
+        'status': state,
+        'progress': progress,
+        'error': task.get('error_message', None)
+    }
+
+
+def _dataset_info_cache_key(dataset_id: str) -> str:
+    """Return the cache key of a dataset's get_dataset_info details"""
+    return f"gee:info:{CACHE_SCHEMA_VERSION}:{dataset_id}"
+
+
+def _cached_dataset_type(dataset_id: str) -> Optional[str]:
+    """Return the dataset type from cached details, None if not cached"""
+    info = cache.get(_dataset_info_cache_key(dataset_id))
+    return info.get('type') if info else None
+
+
+def _temporal_cache_timeout(end_date: Optional[str]) -> int:
+    """Return how long to cache data of a dataset whose last image is on end_date
+
+    Datasets whose last image is older than TEMPORAL_ACTIVE_WINDOW are not
+    expected to change and are cached for a day, datasets that are still
+    being updated, or whose end is unknown, only for an hour.
+    """
+    if end_date:
+        last_image = datetime.strptime(end_date, '%Y-%m-%d')
+        if datetime.now() - last_image > TEMPORAL_ACTIVE_WINDOW:
+            return METADATA_CACHE_TIMEOUT
+    return ACTIVE_DATASET_CACHE_TIMEOUT
+
+
+def variables_cacheable(result: Dict[str, Any]) -> bool:
+    """Return whether a get_available_variables result may be cached
+
+    Failed lookups and the 'default' placeholder band are retried instead.
+    """
+    return not result.get('error') and any(
+        band.get('id') != 'default' for band in result.get('variables', []))
+
+
+def temporal_info_cacheable(result: Dict[str, Any]) -> bool:
+    """Return whether a get_dataset_temporal_info result may be cached"""
+    return bool(result.get('end_date')) and not result.get('error')
+
+
+def _search_cache_key(query: Optional[str], tags: Optional[List[str]],
+                      page: int, per_page: int) -> str:
+    """Build the cache key of a search_datasets page
+
+    Tag order and duplicates do not change the result, so they are
+    normalized away before hashing.
+    """
+    key = '|'.join([
+        query or '',
+        ','.join(sorted(set(tags or []))),
+        str(page),
+        str(per_page)
+    ])
+    digest = hashlib.md5(key.encode('utf-8')).hexdigest()
+    return f"gee:search:{CACHE_SCHEMA_VERSION}:{digest}"
+
+
+def _check_region(region_geom: Any) -> Dict[str, Any]:
+    """Check the structure of a parsed GeoJSON FeatureCollection"""
+    if not region_geom or not isinstance(region_geom, dict) or not region_geom.get('features'):
+        raise ValueError('missing features or invalid structure')
+    feature = region_geom['features'][0]
+    geometry = feature.get('geometry') if isinstance(feature, dict) else None
+    if not isinstance(geometry, dict) or not geometry.get('type') or 'coordinates' not in geometry:
+        raise ValueError('first feature has no geometry type and coordinates')
+    return region_geom
+
+
+@lru_cache(maxsize=64)
+def _load_region_string(region: Union[str, bytes]) -> Dict[str, Any]:
+    """Parse a GeoJSON string; cached because clients resend the same region"""
+    try:
+        region_geom = jsonutils.loads(region)
+    except jsonutils.JSONDecodeError:
+        raise ValueError('not a valid JSON string')
+    return _check_region(region_geom)
+
+
+def validate_region(region: Union[str, bytes, Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the GeoJSON FeatureCollection of a region after checking its structure
+
+    Does not touch Earth Engine, so views can reject a bad region before
+    the client library is initialized. Raises ValueError when the region
+    is not a usable FeatureCollection.
+    """
+    if isinstance(region, (bytes, str)):
+        return _load_region_string(region)
+    return _check_region(region)
+
+
+def parse_region(region: Union[str, bytes, Dict[str, Any]]) -> ee.Geometry:
+    """Return the geometry of the first feature of a GeoJSON region
+
+    Raises ValueError when the region is not a usable FeatureCollection;
+    Earth Engine errors building the geometry propagate unchanged.
+    """
+    return ee.Geometry(validate_region(region)['features'][0]['geometry'])
+
+
+def _bands_from_types(band_names: List[str], band_types: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Build band entries in the getInfo 'bands' shape from bandNames/bandTypes"""
+    return [
+        {'id': band_name, 'data_type': band_types.get(band_name)}
+        for band_name in band_names
+    ]
+
+
+@lru_cache(maxsize=1024)
+def _filename_base(dataset_id: str) -> str:
+    """Return the part of a dataset ID used to name exported files"""
+    return dataset_id.rpartition('/')[2]
+
+
+@lru_cache(maxsize=None)
+def get_http_session():
+    """Return the shared requests session used for catalog HTTP calls
+
+    Connections are pooled so repeated calls reuse the TCP/TLS handshake,
+    and transient failures are retried with exponential backoff.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+    ))
+    return session
+
+
+def _watch_authentication(process: multiprocessing.Process) -> None:
+    """Wait for an OAuth flow process, cancelling it after AUTH_FLOW_TIMEOUT
+
+    ee.Authenticate waits for the OAuth redirect without a timeout, so an
+    abandoned sign-in is only ended by terminating its process.
+    """
+    process.join(AUTH_FLOW_TIMEOUT)
+    if process.is_alive():
+        process.terminate()
+        process.join()
+        logger.warning(
+            "Authentication flow cancelled after %s seconds without a sign-in", AUTH_FLOW_TIMEOUT)
+    elif process.exitcode:
+        logger.warning(
+            "Authentication flow failed with exit code %s", process.exitcode)
+    with _auth_flow_lock:
+        if _auth_flow['process'] is process:
+            _auth_flow['process'] = None
 
 
 class GEEService:
     """Provides methods for interacting with Google Earth Engine API"""
 
     _project_id = None
+    # Project Earth Engine is currently initialized with, None if unknown
+    _initialized_project = None
+    _init_lock = threading.Lock()
 
     @classmethod
     def set_project_id(cls, project_id: str):
         """Set the project ID for future operations"""
         cls._project_id = project_id
 
+    @classmethod
+    def ensure_initialized(cls, project_name: str) -> None:
+        """Initialize Earth Engine with the project unless it is already active"""
+        if cls._initialized_project == project_name:
+            return
+        with cls._init_lock:
+            if cls._initialized_project != project_name:
+                ee.Initialize(project=project_name, opt_url=GEE_ENDPOINT)
+                cls._initialized_project = project_name
+
+    @classmethod
+    def reset_initialization(cls) -> None:
+        """Force the next ensure_initialized call to initialize again"""
+        cls._initialized_project = None
+
     @staticmethod
     def initialize() -> bool:
         """Initialize Earth Engine and check authentication status"""
         try:
             ee.Authenticate()
-            ee.Initialize()
+            ee.Initialize(opt_url=GEE_ENDPOINT)
+            GEEService.reset_initialization()
             return True
         except Exception as e:
-            print(f"Error initializing Earth Engine: {e}")
+            logger.warning("Error initializing Earth Engine: %s", e)
             return False
 
     @staticmethod
     def start_authentication() -> Dict[str, Any]:
         """Start the Earth Engine authentication process
 
+        The OAuth flow runs in a separate process so the request returns
+        immediately; the flow writes the new credentials once the user
+        completes the sign-in, and is cancelled after AUTH_FLOW_TIMEOUT.
+        Only one flow runs at a time.
+
         Returns:
             Dict containing status and message of the authentication process
         """
         try:
-            # Get user's home directory
-            home_dir = str(Path.home())
-            credentials_path = os.path.join(
-                home_dir, '.config', 'earthengine', 'credentials')
-
-            # Remove existing credentials if any
-            if os.path.exists(credentials_path):
-                os.remove(credentials_path)
-
-            # Run authentication command
-            cmd = ['earthengine', 'authenticate']
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.returncode != 0:
-                print(f"Authentication command failed: {result.stderr}")
-                return {
-                    'status': 'error',
-                    'message': result.stderr or 'Failed to start authentication process'
-                }
+            with _auth_flow_lock:
+                if _auth_flow['process'] is not None:
+                    return {
+                        'status': 'error',
+                        'message': 'An authentication process is already in progress. Please complete it or wait for it to expire.'
+                    }
+                # Spawned rather than forked so the child does not inherit
+                # locks held by other request threads
+                process = multiprocessing.get_context('spawn').Process(
+                    target=ee.Authenticate,
+                    kwargs={'auth_mode': 'localhost', 'force': True},
+                    daemon=True
+                )
+                process.start()
+                _auth_flow['process'] = process
 
+            threading.Thread(
+                target=_watch_authentication, args=(process,), daemon=True).start()
             return {
                 'status': 'success',
-                'message': 'Authentication process started. Please check your terminal to complete the process.'
+                'message': f'Authentication process started. Please complete the Google sign-in on the machine running this server within {AUTH_FLOW_TIMEOUT // 60} minutes.'
             }
 
         except Exception as e:
-            print(f"Authentication error: {str(e)}")
+            logger.warning("Authentication error: %s", e)
             return {
                 'status': 'error',
                 'message': str(e)
@@ -78,9 +438,9 @@ class GEEService:
         """Check Earth Engine authentication status"""
         try:
             try:
-                data = json.loads(request.body)
+                data = jsonutils.loads(request.body)
                 project_id = data.get('project_id')
-            except json.JSONDecodeError:
+            except jsonutils.JSONDecodeError:
                 project_id = None
 
             if not project_id:
@@ -91,14 +451,14 @@ class GEEService:
                 }
 
             try:
-                ee.Initialize(project=project_id)
+                GEEService.ensure_initialized(project_id)
                 GEEService.set_project_id(project_id)
 
                 test = ee.Number(1).add(2)
                 result = test.getInfo()
 
                 if result == 3:
-                    print("Authentication successful!")
+                    logger.debug("Authentication successful!")
                     return {
                         'authenticated': True,
                         'status': 'success'
@@ -119,13 +479,14 @@ class GEEService:
                         'message': 'Please complete your registration at https://signup.earthengine.google.com/'
                     }
                 elif "not authorized" in error_msg:
+                    GEEService.reset_initialization()
                     return {
                         'authenticated': False,
                         'status': 'error',
                         'message': 'Please authenticate at https://code.earthengine.google.com first.'
                     }
                 else:
-                    print(f"API call error: {e}")
+                    logger.debug("API call error: %s", e)
                     return {
                         'authenticated': False,
                         'status': 'error',
@@ -133,7 +494,7 @@ class GEEService:
                     }
 
         except Exception as e:
-            print(f"Authentication check failed: {str(e)}")
+            logger.warning("Authentication check failed: %s", e)
             return {
                 'authenticated': False,
                 'status': 'error',
@@ -146,7 +507,7 @@ class GEEService:
         start_date: str,
         end_date: str,
         variable: str,
-        region: str,
+        region: Union[str, Dict[str, Any]],
         export_format: str = 'GeoTIFF',
         scale: int = 1000,
         folder_name: str = 'GEE-Downloads',
@@ -165,8 +526,9 @@ class GEEService:
             End date in format 'YYYY-MM-DD'
         variable : str
             Band/variable name to export
-        region : str
-            GeoJSON string representing the export region
+        region : str or dict
+            GeoJSON FeatureCollection (as a string or parsed) representing
+            the export region
         export_format : str
             Export format (e.g., 'GeoTIFF', 'TFRecord')
         scale : int
@@ -178,18 +540,20 @@ class GEEService:
 
         Returns:
         --------
-        Dict with task information or error message
+        Dict with task information or error message. Invalid dates or
+        variables also set 'error_code' to 'date_range_invalid' or
+        'variable_invalid'.
         """
         try:
-            print(
-                f"\n=== Starting download task for {dataset_id} with project {project_name} ===")
+            logger.debug(
+                "Starting download task for %s with project %s", dataset_id, project_name)
 
             # Ensure Earth Engine is initialized with the correct project ID
             if project_name:
                 try:
-                    ee.Initialize(project=project_name)
-                    print(
-                        f"Re-initialized Earth Engine with project ID: {project_name}")
+                    GEEService.ensure_initialized(project_name)
+                    logger.debug(
+                        "Earth Engine initialized with project ID: %s", project_name)
 
                     # Test the project access with a simple operation
                     try:
@@ -198,56 +562,134 @@ class GEEService:
                             return {'error': f"Failed to initialize Earth Engine with project ID: {project_name}. Test operation failed."}
                     except ee.ee_exception.EEException as test_error:
                         error_msg = str(test_error)
-                        if "Permission denied" in error_msg or "not found" in error_msg or "does not have required permission" in error_msg:
+                        if PERMISSION_ERROR_RE.search(error_msg):
                             return {'error': f"Permission error: Caller does not have required permission to use project {project_name}. Please check your project ID."}
                         else:
-                            print(f"Test operation error: {test_error}")
+                            logger.debug(
+                                "Test operation error: %s", test_error)
                 except Exception as e:
-                    print(
-                        f"Error initializing Earth Engine with project {project_name}: {e}")
+                    logger.debug(
+                        "Error initializing Earth Engine with project %s: %s", project_name, e)
                     error_msg = str(e)
-                    if "Permission denied" in error_msg or "not found" in error_msg or "does not have required permission" in error_msg:
+                    if PERMISSION_ERROR_RE.search(error_msg):
                         return {'error': f"Permission error: Caller does not have required permission to use project {project_name}. Please check your project ID."}
                     # Continue execution as it might already be initialized
 
-            # Parse the region
-            try:
-                if isinstance(region, str):
-                    try:
-                        region_geom = geojson.loads(region)
-                    except Exception as e:
-                        print(f"Error parsing region as JSON: {e}")
-                        return {'error': f"Invalid region format: {str(e)}"}
-                else:
-                    region_geom = region
+            result = GEEService._export_one(
+                dataset_id=dataset_id,
+                start_date=start_date,
+                end_date=end_date,
+                variable=variable,
+                region=region,
+                export_format=export_format,
+                scale=scale,
+                folder_name=folder_name,
+                project_name=project_name
+            )
+            if result.get('task_id'):
+                cache.delete(_task_list_cache_key(project_name))
+            return result
 
-                # Verify the region structure
-                if not region_geom or not isinstance(region_geom, dict) or not region_geom.get('features'):
-                    print("Region missing features or invalid structure")
-                    return {'error': "Invalid region format: missing features or invalid structure"}
+        except Exception as e:
+            logger.exception("Error in start_download_task: %s", e)
+            return {'error': str(e)}
 
-                # Create EE geometry from the first feature's geometry
-                ee_geometry = ee.Geometry(
-                    region_geom['features'][0]['geometry'])
-                print(f"Region geometry parsed successfully")
-            except Exception as e:
-                print(f"Error parsing region geometry: {e}")
+    @staticmethod
+    def start_download_batch(export_requests: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Start several export tasks in parallel against GEE_ENDPOINT
+
+        Parameters:
+        -----------
+        export_requests : list of dict
+            Keyword arguments for each export, as accepted by start_download_task
+
+        Returns:
+        --------
+        List of task IDs in the same order as the requests, None for failed exports
+
+        The workers are forked from the calling process, so call this from a
+        single-threaded process such as a management command, not from a
+        request thread: a lock held by another thread at fork time (logging,
+        the cache, GEEService._init_lock) stays held forever in the child.
+        """
+        if not export_requests:
+            return []
+
+        # Earth Engine sessions cannot be shared across a fork, so every
+        # worker drops the initialization state copied from the parent and
+        # initializes its own client in _batch_export_worker
+        with multiprocessing.Pool(min(BATCH_POOL_SIZE, len(export_requests)),
+                                  initializer=_init_batch_worker) as pool:
+            results = pool.starmap(
+                _batch_export_worker, enumerate(export_requests))
+
+        cache.delete_many({
+            _task_list_cache_key(request.get('project_name'))
+            for request, result in zip(export_requests, results)
+            if result.get('task_id')
+        })
+        return [result.get('task_id') for result in results]
+
+    @staticmethod
+    def _export_one(
+        dataset_id: str,
+        start_date: str,
+        end_date: str,
+        variable: str,
+        region: Union[str, Dict[str, Any]],
+        export_format: str = 'GeoTIFF',
+        scale: int = 1000,
+        folder_name: str = 'GEE-Downloads',
+        project_name: str = None
+    ) -> Dict[str, Any]:
+        """Validate the request and start a single export to Google Drive
+
+        Expects Earth Engine to be initialized already.
+        """
+        try:
+            # Parse the region
+            try:
+                ee_geometry = parse_region(region)
+                logger.debug("Region geometry parsed successfully")
+            except ValueError as e:
+                logger.debug("Error parsing region geometry: %s", e)
                 return {'error': f"Invalid region format: {str(e)}"}
 
+            collection = ee.ImageCollection(dataset_id)
+            filtered_data = collection.filterDate(
+                start_date, end_date).select(variable)
+
+            # Fetch the filtered size and the full time range in a single
+            # round trip instead of one request per check
+            collection_info_request = ee.Dictionary({
+                'size': collection.filterDate(start_date, end_date).size(),
+                'range': collection.reduceColumns(
+                    reducer=ee.Reducer.minMax(),
+                    selectors=['system:time_start']
+                ),
+                'band_names': collection.first().bandNames()
+            })
+
+            # The access check and the collection query are independent, so
+            # run them concurrently when the cached details already say this
+            # is a collection; otherwise the query waits for the access check
+            # and is never sent for single images
+            collection_future = None
+            if _cached_dataset_type(dataset_id) == 'IMAGE_COLLECTION':
+                collection_future = _export_query_executor.submit(
+                    collection_info_request.getInfo)
+
             # Check dataset access before proceeding
             access_check = GEEService.check_dataset_access(
                 dataset_id, project_name)
             if not access_check['success']:
+                if collection_future is not None:
+                    collection_future.cancel()
                 error_msg = access_check.get('message', access_check['error'])
-                print(f"Access error: {error_msg}")
+                logger.debug("Access error: %s", error_msg)
                 return {'error': error_msg}
 
-            # Validate date range
-            if not GEEService.validate_date_range(dataset_id, start_date, end_date):
-                print(
-                    f"Date range validation failed for {start_date} to {end_date}")
-                return {'error': 'Selected date range is not available for this dataset'}
-
             # Create a list of dates for time series if needed
             single_date = start_date == end_date
 
@@ -256,36 +698,55 @@ class GEEService:
             try:
                 dataset_type = access_check['info'].get('type', '')
                 is_collection = dataset_type == 'IMAGE_COLLECTION'
-                print(f"Dataset type: {dataset_type}")
+                logger.debug("Dataset type: %s", dataset_type)
             except Exception as e:
-                print(f"Error determining dataset type: {e}")
+                logger.debug("Error determining dataset type: %s", e)
 
             # Try first as image, then as collection if that fails
             image = None
             try:
                 if not is_collection:
                     # For single image datasets
-                    print(f"Processing as single image: {dataset_id}")
+                    logger.debug("Processing as single image: %s", dataset_id)
+                    band_names = {
+                        band.get('id') for band in access_check['info'].get('bands', [])}
+                    if band_names and variable not in band_names:
+                        return dict(VARIABLE_INVALID_ERROR)
                     image = ee.Image(dataset_id).select(variable)
                 else:
                     # For image collections
-                    print(
-                        f"Processing as image collection from {start_date} to {end_date}")
-                    collection = ee.ImageCollection(dataset_id)
-                    filtered_data = collection.filterDate(
-                        start_date, end_date).select(variable)
-
-                    # Get collection size
-                    collection_size = filtered_data.size().getInfo()
-                    print(f"Found {collection_size} images in date range")
+                    logger.debug(
+                        "Processing as image collection from %s to %s", start_date, end_date)
+                    if collection_future is not None:
+                        collection_info = collection_future.result()
+                    else:
+                        collection_info = collection_info_request.getInfo()
+                    collection_size = collection_info['size']
+                    time_range = collection_info['range']
+                    logger.debug(
+                        "Found %s images in date range", collection_size)
+
+                    if variable not in collection_info['band_names']:
+                        return dict(VARIABLE_INVALID_ERROR)
+
+                    available_range = ""
+                    if time_range.get('min') is not None and time_range.get('max') is not None:
+                        dataset_start = datetime.fromtimestamp(
+                            time_range['min'] / 1000)
+                        dataset_end = datetime.fromtimestamp(
+                            time_range['max'] / 1000)
+                        selected_start = datetime.strptime(
+                            start_date, '%Y-%m-%d')
+                        selected_end = datetime.strptime(end_date, '%Y-%m-%d')
+
+                        if not (dataset_start <= selected_end and selected_start <= dataset_end):
+                            logger.debug(
+                                "Date range validation failed for %s to %s", start_date, end_date)
+                            return dict(DATE_RANGE_INVALID_ERROR)
+
+                        available_range = f" Data is available from {dataset_start.strftime('%Y-%m-%d')} to {dataset_end.strftime('%Y-%m-%d')}."
 
                     if collection_size == 0:
-                        date_info = GEEService.get_dataset_temporal_info(
-                            dataset_id, project_name)
-                        available_range = ""
-                        if date_info.get('start_date') and date_info.get('end_date'):
-                            available_range = f" Data is available from {date_info.get('start_date')} to {date_info.get('end_date')}."
-
                         return {
                             'error': f'No data available for the selected date range ({start_date} to {end_date}).{available_range} Please try a different date range.'
                         }
@@ -293,30 +754,27 @@ class GEEService:
                     # Compute mean image (or use more appropriate reducer if needed)
                     image = filtered_data.mean()
             except Exception as e:
-                print(f"Error processing dataset: {e}")
+                logger.debug("Error processing dataset: %s", e)
                 return {'error': f"Failed to process dataset: {str(e)}"}
 
             # Format the output name
             try:
-                if isinstance(dataset_id, str) and '/' in dataset_id:
-                    filename_base = dataset_id.split('/')[-1]
-                else:
-                    filename_base = str(dataset_id).replace('/', '_')
+                filename_base = _filename_base(str(dataset_id))
 
                 date_suffix = start_date
                 if start_date != end_date:
                     date_suffix = f"{start_date}_to_{end_date}"
 
                 output_name = f"{filename_base}_{variable}_{date_suffix}"
-                print(f"Output filename: {output_name}")
+                logger.debug("Output filename: %s", output_name)
             except Exception as e:
-                print(f"Error formatting output name: {e}")
+                logger.debug("Error formatting output name: %s", e)
                 output_name = f"earthengine_export_{variable}"
 
             # Create and start the export task
             try:
-                print(
-                    f"Starting export to folder '{folder_name}' with format '{export_format}'")
+                logger.debug(
+                    "Starting export to folder '%s' with format '%s'", folder_name, export_format)
                 task = ee.batch.Export.image.toDrive(
                     image=image,
                     description=output_name,
@@ -332,7 +790,8 @@ class GEEService:
 
                 # Ensure task.id is a string
                 task_id = str(task.id) if hasattr(task, 'id') else "unknown"
-                print(f"Successfully started export task with ID: {task_id}")
+                logger.debug(
+                    "Successfully started export task with ID: %s", task_id)
 
                 # Return task information with the folder name included
                 return {
@@ -343,13 +802,11 @@ class GEEService:
                     'filename': f"{output_name}.{export_format.lower()}"
                 }
             except Exception as e:
-                print(f"Error creating or starting export task: {e}")
+                logger.debug("Error creating or starting export task: %s", e)
                 return {'error': f'Failed to start export task: {str(e)}'}
 
         except Exception as e:
-            print(f"Error in start_download_task: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in _export_one: %s", e)
             return {'error': str(e)}
 
     @staticmethod
@@ -372,127 +829,150 @@ class GEEService:
             - error: Error message if task failed
         """
         try:
-            print(f"Getting status for task ID: {task_id}")
+            logger.debug("Getting status for task ID: %s", task_id)
 
             # Ensure Earth Engine is initialized with the correct project ID
             if project_name:
                 try:
-                    ee.Initialize(project=project_name)
-                    print(
-                        f"Re-initialized Earth Engine with project ID: {project_name} for task status")
+                    GEEService.ensure_initialized(project_name)
+                    logger.debug(
+                        "Earth Engine initialized with project ID: %s for task status", project_name)
                 except Exception as e:
-                    print(
-                        f"Error initializing Earth Engine with project {project_name}: {e}")
+                    logger.debug(
+                        "Error initializing Earth Engine with project %s: %s", project_name, e)
                     # Continue execution as it might already be initialized with default project
 
             # Explicitly reinitialize with "ee-thrcle421" if no project provided
             # This is a fallback to ensure we're using the known working project
             elif not project_name:
                 try:
-                    ee.Initialize(project="ee-thrcle421")
-                    print(
-                        "Re-initialized Earth Engine with default project ID: ee-thrcle421")
+                    GEEService.ensure_initialized("ee-thrcle421")
+                    logger.debug(
+                        "Earth Engine initialized with default project ID: ee-thrcle421")
                 except Exception as e:
-                    print(
-                        f"Error initializing Earth Engine with default project: {e}")
-
-            # Get the task list from Earth Engine
-            tasks = ee.data.getTaskList()
-            print(f"Total tasks: {len(tasks)}")
-
-            # Print task structure for debugging
-            if tasks and len(tasks) > 0:
-                print(f"First task type: {type(tasks[0])}")
-                print(
-                    f"First task keys: {tasks[0].keys() if isinstance(tasks[0], dict) else 'Not a dict'}")
-                print(f"First task: {tasks[0]}")
+                    logger.debug(
+                        "Error initializing Earth Engine with default project: %s", e)
 
             # Make sure task_id is a string
             if not isinstance(task_id, str):
                 task_id = str(task_id)
 
-            # Find the matching task
+            # Concurrent polls share the briefly cached task list; a task
+            # missing from it is looked up directly as an operation
             task = None
-            for t in tasks:
+            try:
+                task = _get_all_tasks(project_name).get(task_id)
+            except Exception as e:
+                logger.debug("Task list lookup failed: %s", e)
+
+            if task is None:
                 try:
-                    if isinstance(t, dict) and 'id' in t and str(t['id']) == task_id:
-                        task = t
-                        break
+                    operation = ee.data.getOperation(
+                        f"projects/{project_name or 'ee-thrcle421'}/operations/{task_id}")
+                    task = _operation_to_task(operation)
                 except Exception as e:
-                    print(f"Error comparing task: {e}")
-                    continue
+                    logger.debug("Operation lookup failed: %s", e)
 
             # Handle case where task is not found
             if not task:
-                print(f"Task with ID {task_id} not found")
+                logger.debug("Task with ID %s not found", task_id)
                 return {
                     'status': 'FAILED',
                     'progress': 0,
                     'error': 'Task not found or may have expired'
                 }
 
-            print(f"Found task: {task}")
+            logger.debug("Found task: %s", task)
 
-            # Extract state and progress with fallbacks for safety
-            state = 'UNKNOWN'
-            progress = 0
-            error_msg = None
-
-            if isinstance(task, dict):
-                state = task.get('state', 'UNKNOWN')
-
-                # Calculate progress based on state
-                if state == 'COMPLETED':
-                    progress = 100
-                elif state == 'FAILED' or state == 'CANCELLED':
-                    progress = 0
-                else:
-                    # For READY, RUNNING, etc. states
-                    progress = task.get('progress', 0)
-                    if progress is None:
-                        progress = 0
-                    elif isinstance(progress, float):
-                        # Convert from fraction to percentage
-                        progress = int(progress * 100)
-
-                # Get error message if available
-                error_msg = task.get('error_message', None)
-
-            # Build result dictionary
-            result = {
-                'status': state,
-                'progress': progress,
-                'error': error_msg
-            }
-            print(f"Returning result: {result}")
+            result = _task_to_status(task)
+            logger.debug("Returning result: %s", result)
             return result
 
         except Exception as e:
-            print(f"Error getting task status: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error getting task status: %s", e)
             return {
                 'status': 'FAILED',
                 'progress': 0,
                 'error': f"Error checking task status: {str(e)}"
             }
 
+    @staticmethod
+    def get_task_statuses(task_ids: List[str], project_name: str = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the status of several download tasks with a single task list request
+
+        Parameters:
+        -----------
+        task_ids : list of str
+            The Earth Engine task IDs to check
+        project_name : str, optional
+            The Earth Engine project ID to use
+
+        Returns:
+        --------
+        Dict mapping each task ID to the status information returned by
+        get_task_status
+        """
+        try:
+            GEEService.ensure_initialized(project_name or "ee-thrcle421")
+            tasks = _get_all_tasks(project_name)
+        except Exception as e:
+            logger.debug("Error getting task statuses: %s", e)
+            return {
+                str(task_id): {
+                    'status': 'FAILED',
+                    'progress': 0,
+                    'error': f"Error checking task status: {str(e)}"
+                }
+                for task_id in task_ids
+            }
+
+        statuses = {}
+        for task_id in map(str, task_ids):
+            task = tasks.get(task_id)
+            if task:
+                statuses[task_id] = _task_to_status(task)
+            else:
+                statuses[task_id] = {
+                    'status': 'FAILED',
+                    'progress': 0,
+                    'error': 'Task not found or may have expired'
+                }
+        return statuses
+
     @staticmethod
     def get_available_variables(dataset_id: str, project_name: str = None) -> Dict:
-        """Get available variables for a dataset"""
+        """Get available variables for a dataset
+
+        Lookups that found real bands are cached since dataset metadata
+        rarely changes.
+        Access depends on the project, so each project has its own entry.
+        """
+        cache_key = f"gee:vars:{CACHE_SCHEMA_VERSION}:{project_name or ''}:{dataset_id}"
+        result = cache.get(cache_key)
+        if result is None:
+            result = GEEService._fetch_available_variables(
+                dataset_id, project_name)
+            if variables_cacheable(result):
+                cache.set(cache_key, result, METADATA_CACHE_TIMEOUT)
+        return result
+
+    @staticmethod
+    def _fetch_available_variables(dataset_id: str, project_name: str = None) -> Dict:
+        """Query Earth Engine for the variables of a dataset"""
         try:
-            print(
-                f"\n=== Getting variables for dataset: {dataset_id} with project {project_name} ===")
+            logger.debug(
+                "Getting variables for dataset: %s with project %s", dataset_id, project_name)
 
             # Ensure Earth Engine is initialized with the correct project ID
             if project_name:
                 try:
-                    ee.Initialize(project=project_name)
-                    print(
-                        f"Re-initialized Earth Engine with project ID: {project_name} for getting variables")
+                    GEEService.ensure_initialized(project_name)
+                    logger.debug(
+                        "Earth Engine initialized with project ID: %s for getting variables", project_name)
                 except Exception as e:
-                    print(
-                        f"Error initializing Earth Engine with project {project_name}: {e}")
+                    logger.debug(
+                        "Error initializing Earth Engine with project %s: %s", project_name, e)
                     # Continue execution as it might already be initialized
 
             access_check = GEEService.check_dataset_access(
@@ -500,7 +980,7 @@ class GEEService:
             if not access_check['success']:
                 error_message = access_check.get(
                     'message', access_check['error'])
-                print(f"Access error: {error_message}")
+                logger.debug("Access error: %s", error_message)
                 return {
                     'variables': [{
                         'id': 'default',
@@ -514,7 +994,7 @@ class GEEService:
                 }
 
             basic_info = access_check['info']
-            print(f"Basic info type: {type(basic_info)}")
+            logger.debug("Basic info type: %s", type(basic_info))
 
             description = basic_info.get('description', '')
             if not description and 'properties' in basic_info:
@@ -524,52 +1004,54 @@ class GEEService:
             if not title and 'properties' in basic_info:
                 title = basic_info['properties'].get('title', '')
 
-            tags = []
-            if 'keywords' in basic_info:
-                tags.extend(basic_info['keywords'])
-            if 'properties' in basic_info and 'keywords' in basic_info['properties']:
-                tags.extend(basic_info['properties']['keywords'])
-            tags = list(set(tags))
+            # Merge both keyword lists, dropping duplicates but keeping order
+            tags = list(dict.fromkeys(chain(
+                basic_info.get('keywords', []),
+                basic_info.get('properties', {}).get('keywords', [])
+            )))
 
             bands_info = basic_info.get('bands', [])
-            print(f"\nOriginal bands_info from basic_info: {bands_info}")
+            logger.debug("Original bands_info from basic_info: %s", bands_info)
 
             if not bands_info and basic_info.get('type') == 'IMAGE_COLLECTION':
-                print("\nTrying to get bands from first image of collection...")
+                logger.debug(
+                    "Trying to get bands from first image of collection...")
                 try:
                     first_image = ee.ImageCollection(dataset_id).first()
                     first_image_info = first_image.getInfo()
                     bands_info = first_image_info.get('bands', [])
-                    print(f"Bands info from first image: {bands_info}")
+                    logger.debug("Bands info from first image: %s", bands_info)
                 except Exception as e:
-                    print(f"Error getting bands from first image: {e}")
+                    logger.warning(
+                        "Error getting bands from first image of %s: %s", dataset_id, e)
 
             if not isinstance(bands_info, list):
-                print(
-                    f"\nWarning: bands_info is not a list, it's a {type(bands_info)}")
+                logger.debug(
+                    "Warning: bands_info is not a list, it's a %s", type(bands_info))
                 bands_info = []
 
             if not bands_info:
-                print(f"\nNo bands found for {dataset_id}, returning default")
+                logger.debug(
+                    "No bands found for %s, returning default", dataset_id)
                 bands_info = [{
                     'id': 'default',
                     'name': 'Default Band',
                     'description': 'Default band for this dataset'
                 }]
 
-            print(f"\nFinal bands_info: {bands_info}")
+            logger.debug("Final bands_info: %s", bands_info)
             result = {
                 'variables': bands_info,
                 'description': description,
                 'tags': tags,
                 'title': title
             }
-            print(f"\nFinal response: {result}")
+            logger.debug("Final response: %s", result)
             return result
 
         except ee.ee_exception.EEException as e:
             error_msg = str(e)
-            print(f"Earth Engine API error: {error_msg}")
+            logger.debug("Earth Engine API error: %s", error_msg)
             if "permission" in error_msg.lower():
                 return {
                     'variables': [{
@@ -596,9 +1078,7 @@ class GEEService:
                 }
 
         except Exception as e:
-            import traceback
-            print(f"Error getting variables: {e}")
-            print(traceback.format_exc())
+            logger.exception("Error getting variables: %s", e)
             return {
                 'variables': [{
                     'id': 'default',
@@ -607,25 +1087,43 @@ class GEEService:
                 }],
                 'description': '',
                 'tags': [],
-                'title': ''
+                'title': '',
+                'error': str(e)
             }
 
     @staticmethod
     def get_dataset_temporal_info(dataset_id: str, project_name: str = None) -> Dict:
-        """Get temporal information for a dataset"""
+        """Get temporal information for a dataset
+
+        Lookups that found a time range are cached for
+        _temporal_cache_timeout of their end date.
+        """
+        cache_key = f"gee:temporal:{CACHE_SCHEMA_VERSION}:{dataset_id}"
+        result = cache.get(cache_key)
+        if result is None:
+            result = GEEService._fetch_dataset_temporal_info(
+                dataset_id, project_name)
+            if temporal_info_cacheable(result):
+                cache.set(cache_key, result,
+                          _temporal_cache_timeout(result['end_date']))
+        return result
+
+    @staticmethod
+    def _fetch_dataset_temporal_info(dataset_id: str, project_name: str = None) -> Dict:
+        """Query Earth Engine for the temporal extent of a dataset"""
         try:
-            print(
-                f"\n=== Getting temporal info for dataset: {dataset_id} with project {project_name} ===")
+            logger.debug(
+                "Getting temporal info for dataset: %s with project %s", dataset_id, project_name)
 
             # Ensure Earth Engine is initialized with the correct project ID
             if project_name:
                 try:
-                    ee.Initialize(project=project_name)
-                    print(
-                        f"Re-initialized Earth Engine with project ID: {project_name} for temporal info")
+                    GEEService.ensure_initialized(project_name)
+                    logger.debug(
+                        "Earth Engine initialized with project ID: %s for temporal info", project_name)
                 except Exception as e:
-                    print(
-                        f"Error initializing Earth Engine with project {project_name}: {e}")
+                    logger.debug(
+                        "Error initializing Earth Engine with project %s: %s", project_name, e)
                     # Continue execution as it might already be initialized
 
             try:
@@ -639,33 +1137,34 @@ class GEEService:
                         'end_date': date_str
                     }
             except Exception as e:
-                print(f"Not a single image or error: {e}")
+                logger.debug("Not a single image or error: %s", e)
 
             try:
                 dataset = ee.ImageCollection(dataset_id)
-                dates = dataset.aggregate_array('system:time_start').getInfo()
+                time_range = dataset.reduceColumns(
+                    reducer=ee.Reducer.minMax(),
+                    selectors=['system:time_start']
+                ).getInfo()
 
-                if dates and len(dates) > 0:
+                if time_range.get('min') is not None and time_range.get('max') is not None:
                     start_date = datetime.fromtimestamp(
-                        min(dates) / 1000).strftime('%Y-%m-%d')
+                        time_range['min'] / 1000).strftime('%Y-%m-%d')
                     end_date = datetime.fromtimestamp(
-                        max(dates) / 1000).strftime('%Y-%m-%d')
+                        time_range['max'] / 1000).strftime('%Y-%m-%d')
 
                     return {
                         'start_date': start_date,
                         'end_date': end_date
                     }
             except Exception as e:
-                print(f"Not an image collection or error: {e}")
+                logger.debug("Not an image collection or error: %s", e)
 
             return {
                 'start_date': None,
                 'end_date': None
             }
         except Exception as e:
-            print(f"Error getting temporal info: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error getting temporal info: %s", e)
             return {
                 'start_date': None,
                 'end_date': None,
@@ -680,68 +1179,129 @@ class GEEService:
         Only search by ID (fuzzy match) and tags with pagination support
         """
         try:
-            datasets = DatasetMetadata.objects.all()
-
-            if query:
-                datasets = datasets.filter(id__icontains=query)
-
-            if tags:
-                for tag in tags:
-                    datasets = datasets.filter(tags__name__icontains=tag)
-
-            total_count = datasets.count()
-
-            start = (page - 1) * per_page
-            end = start + per_page
-
-            paginated_datasets = datasets[start:end]
-
-            results = []
-            for dataset in paginated_datasets:
-                results.append({
-                    'id': dataset.id,
-                    'title': dataset.title,
-                    'description': dataset.description,
-                    'provider': dataset.provider,
-                    'temporal_resolution': dataset.temporal_resolution,
-                    'spatial_resolution': dataset.spatial_resolution,
-                    'start_date': dataset.start_date.strftime('%Y-%m-%d') if dataset.start_date else '',
-                    'end_date': dataset.end_date.strftime('%Y-%m-%d') if dataset.end_date else '',
-                    'tags': [tag.name for tag in dataset.tags.all()],
-                    'thumbnail_url': dataset.thumbnail_url,
-                    'documentation_url': dataset.documentation_url,
-                    'asset_url': dataset.asset_url
-                })
-
-            total_pages = (total_count + per_page - 1) // per_page
-
-            return {
-                'datasets': results,
-                'total_count': total_count,
-                'total_pages': total_pages,
-                'current_page': page
-            }
-
+            return GEEService._query_datasets(query, tags, page, per_page)
         except Exception as e:
-            print(f"Error searching datasets: {e}")
+            logger.warning("Error searching datasets: %s", e)
             return {
                 'datasets': [],
                 'total_count': 0,
                 'total_pages': 0,
-                'current_page': page
+                'current_page': page,
+                'error': str(e)
             }
 
+    @staticmethod
+    def search_datasets_json(query: str = None, tags: Optional[List[str]] = None,
+                             page: int = 1, per_page: int = 10) -> bytes:
+        """Return a search_datasets page already encoded as JSON
+
+        The encoded pages are cached for SEARCH_CACHE_TIMEOUT since the
+        catalog only changes when load_gee_catalog runs, so repeated
+        requests for a page skip serialization as well as the database.
+        """
+        cache_key = f"{_search_cache_key(query, tags, page, per_page)}:json"
+        body = cache.get(cache_key)
+        if body is None:
+            result = GEEService.search_datasets(query, tags, page, per_page)
+            body = jsonutils.dumps(result)
+            if not result.get('error'):
+                cache.set(cache_key, body, SEARCH_CACHE_TIMEOUT)
+        return body
+
+    @staticmethod
+    def _query_datasets(query: Optional[str], tags: Optional[List[str]],
+                        page: int, per_page: int) -> Dict[str, Any]:
+        """Run a catalog search against the database"""
+        datasets = DatasetMetadata.objects.all()
+
+        if query:
+            datasets = datasets.filter(id__icontains=query)
+
+        if tags:
+            # Tags come from the tag picker, so match names exactly and
+            # keep datasets carrying all of them in a single join
+            tags = set(tags)
+            datasets = datasets.filter(tags__name__in=tags).annotate(
+                _tag_match=Count('tags', distinct=True)
+            ).filter(_tag_match=len(tags))
+
+        total_count = datasets.count()
+        total_pages = (total_count + per_page - 1) // per_page
+        page = max(1, min(page, total_pages or 1))
+        start = (page - 1) * per_page
+
+        # Only the requested page is fetched, with the tag names of all
+        # its rows loaded in one extra query
+        page_items = datasets.prefetch_related(
+            Prefetch('tags', queryset=DatasetTag.objects.only('name'))
+        )[start:start + per_page]
+
+        results = []
+        for dataset in page_items:
+            results.append({
+                'id': dataset.id,
+                'title': dataset.title,
+                'description': dataset.description,
+                'provider': dataset.provider,
+                'temporal_resolution': dataset.temporal_resolution,
+                'spatial_resolution': dataset.spatial_resolution,
+                'start_date': dataset.start_date.strftime('%Y-%m-%d') if dataset.start_date else '',
+                'end_date': dataset.end_date.strftime('%Y-%m-%d') if dataset.end_date else '',
+                'tags': [tag.name for tag in dataset.tags.all()],
+                'thumbnail_url': dataset.thumbnail_url,
+                'documentation_url': dataset.documentation_url,
+                'asset_url': dataset.asset_url
+            })
+
+        return {
+            'datasets': results,
+            'total_count': total_count,
+            'total_pages': total_pages,
+            'current_page': page
+        }
+
+    @staticmethod
+    def suggest_tags(term: str, limit: int = 20) -> List[str]:
+        """Return up to limit tag names starting with term, ignoring case"""
+        keys, names = _get_tag_index()
+        prefix = term.casefold()
+        start = bisect_left(keys, prefix)
+        results = []
+        for key, name in zip(keys[start:start + limit], names[start:start + limit]):
+            if not key.startswith(prefix):
+                break
+            results.append(name)
+        return results
+
     @staticmethod
     def get_dataset_info(dataset_id: str) -> Optional[Dict]:
-        """Get detailed information about a specific dataset"""
+        """Get detailed information about a specific dataset
+
+        Results are cached with the same lifetime rules as
+        get_dataset_temporal_info. Failed lookups, and details degraded by a
+        failed detail request (marked with 'error'), are not cached.
+        """
+        cache_key = _dataset_info_cache_key(dataset_id)
+        info = cache.get(cache_key)
+        if info is None:
+            info = GEEService._fetch_dataset_info(dataset_id)
+            if info is not None and not info.get('error'):
+                cache.set(cache_key, info,
+                          _temporal_cache_timeout(info.get('end_time')))
+        return info
+
+    @staticmethod
+    def _fetch_dataset_info(dataset_id: str) -> Optional[Dict]:
+        """Query Earth Engine for the details of a dataset"""
         try:
             basic_info = ee.data.getInfo(dataset_id)
             if not basic_info:
-                print(f"Could not get basic info for dataset: {dataset_id}")
+                logger.debug(
+                    "Could not get basic info for dataset: %s", dataset_id)
                 return None
 
             dataset_type = basic_info.get('type', '')
-            print(f"Dataset type: {dataset_type}")
+            logger.debug("Dataset type: %s", dataset_type)
 
             info = {
                 'id': dataset_id,
@@ -768,66 +1328,71 @@ class GEEService:
                 try:
                     image = ee.Image(dataset_id)
 
+                    # Evaluate everything the page needs in one request
+                    payload = {
+                        'time_start': image.get('system:time_start'),
+                        'geometry': image.geometry().bounds()
+                    }
+                    if not info['bands']:
+                        payload['band_names'] = image.bandNames()
+                        payload['band_types'] = image.bandTypes()
+                    result = ee.Dictionary(payload).getInfo()
+
                     if not info['bands']:
-                        bands_info = []
-                        band_names = image.bandNames().getInfo()
-                        for band_name in band_names:
-                            bands_info.append({
-                                'id': band_name,
-                                'data_type': image.select(band_name).dataType().getInfo()
-                            })
-                        info['bands'] = bands_info
-
-                    system_time = image.get('system:time_start').getInfo()
+                        info['bands'] = _bands_from_types(
+                            result['band_names'], result['band_types'])
+
+                    system_time = result.get('time_start')
                     if system_time:
                         info['start_time'] = datetime.fromtimestamp(
                             system_time / 1000).strftime('%Y-%m-%d')
                         info['end_time'] = info['start_time']
 
-                    info['geometry'] = image.geometry().bounds().getInfo()
+                    info['geometry'] = result['geometry']
 
                 except Exception as e:
-                    print(f"Error getting additional info for image: {e}")
+                    logger.warning(
+                        "Error getting additional info for image %s: %s", dataset_id, e)
+                    info['error'] = str(e)
 
             elif dataset_type == 'IMAGE_COLLECTION':
                 try:
                     collection = ee.ImageCollection(dataset_id)
                     first_image = collection.first()
 
+                    # Evaluate everything the page needs in one request
+                    payload = {
+                        'size': collection.size(),
+                        'time_range': collection.reduceColumns(
+                            reducer=ee.Reducer.minMax(),
+                            selectors=['system:time_start']
+                        ),
+                        'geometry': first_image.geometry().bounds()
+                    }
+                    if not info['bands']:
+                        payload['band_names'] = first_image.bandNames()
+                        payload['band_types'] = first_image.bandTypes()
+                    result = ee.Dictionary(payload).getInfo()
+
                     if not info['bands']:
-                        bands_info = []
-                        if first_image:
-                            first_image_info = first_image.getInfo()
-                            if 'bands' in first_image_info:
-                                info['bands'] = first_image_info['bands']
-                            else:
-                                band_names = first_image.bandNames().getInfo()
-                                for band_name in band_names:
-                                    bands_info.append({
-                                        'id': band_name,
-                                        'data_type': first_image.select(band_name).dataType().getInfo()
-                                    })
-                                info['bands'] = bands_info
-
-                    info['size'] = collection.size().getInfo()
-
-                    time_range = collection.reduceColumns(
-                        reducer=ee.Reducer.minMax(),
-                        selectors=['system:time_start']
-                    ).getInfo()
-
-                    if 'min' in time_range and 'max' in time_range:
+                        info['bands'] = _bands_from_types(
+                            result['band_names'], result['band_types'])
+
+                    info['size'] = result['size']
+
+                    time_range = result['time_range']
+                    if time_range.get('min') is not None and time_range.get('max') is not None:
                         info['start_time'] = datetime.fromtimestamp(
                             time_range['min'] / 1000).strftime('%Y-%m-%d')
                         info['end_time'] = datetime.fromtimestamp(
                             time_range['max'] / 1000).strftime('%Y-%m-%d')
 
-                    if first_image:
-                        info['geometry'] = first_image.geometry().bounds().getInfo()
+                    info['geometry'] = result['geometry']
 
                 except Exception as e:
-                    print(
-                        f"Error getting additional info for image collection: {e}")
+                    logger.warning(
+                        "Error getting additional info for image collection %s: %s", dataset_id, e)
+                    info['error'] = str(e)
 
             # In your get_dataset_info method, add this as a fallback
             if 'geometry' not in info:
@@ -847,8 +1412,8 @@ class GEEService:
 
                     # If we still don't have geometry, create a default world bounding box
                     if 'geometry' not in info:
-                        print(
-                            f"Creating default world geometry for {dataset_id}")
+                        logger.debug(
+                            "Creating default world geometry for %s", dataset_id)
                         # Simple world bounding box [-180, -90, 180, 90]
                         info['geometry'] = {
                             'type': 'Polygon',
@@ -858,7 +1423,7 @@ class GEEService:
                             ]]
                         }
                 except Exception as e:
-                    print(f"Error creating fallback geometry: {e}")
+                    logger.debug("Error creating fallback geometry: %s", e)
                     # Create a simple world bounding box as last resort
                     info['geometry'] = {
                         'type': 'Polygon',
@@ -868,56 +1433,60 @@ class GEEService:
                         ]]
                     }
 
-            print(f"Final dataset info: {info}")
+            logger.debug("Final dataset info: %s", info)
             return info
 
         except Exception as e:
-            print(f"Error in get_dataset_info: {e}")
+            logger.warning("Error in get_dataset_info: %s", e)
             return None
 
+    @staticmethod
+    def _get_temporal_bounds(dataset_id: str) -> Optional[Tuple[datetime, datetime]]:
+        """Get the first and last image dates of a dataset
+
+        Returns None for datasets without a time range to validate against,
+        such as single images. The range comes from the cached
+        get_dataset_temporal_info.
+        """
+        dataset_type = _cached_dataset_type(dataset_id)
+        if dataset_type is None:
+            dataset_type = (ee.data.getInfo(dataset_id) or {}).get('type')
+        if dataset_type == 'IMAGE':
+            return None
+
+        info = GEEService.get_dataset_temporal_info(dataset_id)
+        if not (info.get('start_date') and info.get('end_date')):
+            return None
+        return (
+            datetime.strptime(info['start_date'], '%Y-%m-%d'),
+            datetime.strptime(info['end_date'], '%Y-%m-%d')
+        )
+
     @staticmethod
     def validate_date_range(dataset_id: str, start_date: str, end_date: str) -> bool:
         """Validate if the selected date range is available for the dataset"""
         try:
-            basic_info = ee.data.getInfo(dataset_id)
-            if basic_info and basic_info.get('type') == 'IMAGE':
-                print("Dataset is a single image, date range validation not needed")
+            bounds = GEEService._get_temporal_bounds(dataset_id)
+            if bounds is None:
+                logger.debug(
+                    "Dataset has no time range, date range validation not needed")
                 return True
 
-            try:
-                dataset = ee.ImageCollection(dataset_id)
-                dates = dataset.aggregate_array('system:time_start').getInfo()
-
-                if not dates or len(dates) == 0:
-                    print(
-                        "No dates found in dataset, assuming date validation is not applicable")
-                    return True
+            dataset_start, dataset_end = bounds
+            selected_start = datetime.strptime(start_date, '%Y-%m-%d')
+            selected_end = datetime.strptime(end_date, '%Y-%m-%d')
 
-                dataset_start = datetime.fromtimestamp(min(dates) / 1000)
-                dataset_end = datetime.fromtimestamp(max(dates) / 1000)
+            logger.debug(
+                "Dataset date range: %s to %s", dataset_start, dataset_end)
+            logger.debug(
+                "Selected date range: %s to %s", selected_start, selected_end)
 
-                selected_start = datetime.strptime(start_date, '%Y-%m-%d')
-                selected_end = datetime.strptime(end_date, '%Y-%m-%d')
-
-                print(f"Dataset date range: {dataset_start} to {dataset_end}")
-                print(
-                    f"Selected date range: {selected_start} to {selected_end}")
-
-                is_valid = dataset_start <= selected_end and selected_start <= dataset_end
-                print(f"Date range validation result: {is_valid}")
-                return is_valid
-            except Exception as e:
-                print(f"Error checking date range for ImageCollection: {e}")
-                try:
-                    image = ee.Image(dataset_id)
-                    print("Dataset loaded as Image, date range validation not needed")
-                    return True
-                except Exception as img_error:
-                    print(f"Also failed to load as Image: {img_error}")
-                    return True
+            is_valid = dataset_start <= selected_end and selected_start <= dataset_end
+            logger.debug("Date range validation result: %s", is_valid)
+            return is_valid
 
         except Exception as e:
-            print(f"Error validating date range: {e}")
+            logger.debug("Error validating date range: %s", e)
             return True
 
     @staticmethod
@@ -926,7 +1495,7 @@ class GEEService:
         start_date: str,
         end_date: str,
         variable: str,
-        region: str,
+        region: Union[str, Dict[str, Any]],
         export_format: str = 'GeoTIFF',
         scale: int = 1000,
         folder_name: str = 'GEE-Downloads',
@@ -934,18 +1503,18 @@ class GEEService:
     ) -> Dict[str, Any]:
         """Generate a URL for direct download of the selected dataset"""
         try:
-            print(
-                f"\n=== Getting download URL for {dataset_id} with project {project_name} ===")
+            logger.debug(
+                "Getting download URL for %s with project %s", dataset_id, project_name)
 
             # Ensure Earth Engine is initialized with the correct project ID
             if project_name:
                 try:
-                    ee.Initialize(project=project_name)
-                    print(
-                        f"Re-initialized Earth Engine with project ID: {project_name}")
+                    GEEService.ensure_initialized(project_name)
+                    logger.debug(
+                        "Earth Engine initialized with project ID: %s", project_name)
                 except Exception as e:
-                    print(
-                        f"Error initializing Earth Engine with project {project_name}: {e}")
+                    logger.debug(
+                        "Error initializing Earth Engine with project %s: %s", project_name, e)
                     # Continue execution as it might already be initialized
 
             # First check what kind of dataset we're dealing with
@@ -958,19 +1527,20 @@ class GEEService:
                     # Test if we can access it as an ImageCollection
                     size_check = dataset.size().getInfo()
                     dataset_type = 'IMAGE_COLLECTION'
-                    print(
-                        f"Dataset is an ImageCollection with {size_check} images")
+                    logger.debug(
+                        "Dataset is an ImageCollection with %s images", size_check)
                 except Exception as coll_error:
-                    print(f"Not an ImageCollection or error: {coll_error}")
+                    logger.debug(
+                        "Not an ImageCollection or error: %s", coll_error)
                     # If not an ImageCollection, try as an Image
                     try:
                         image_test = ee.Image(dataset_id)
                         # Test if we can access it as an Image
                         _ = image_test.bandNames().getInfo()
                         dataset_type = 'IMAGE'
-                        print(f"Dataset is a single Image")
+                        logger.debug("Dataset is a single Image")
                     except Exception as img_error:
-                        print(f"Not an Image either: {img_error}")
+                        logger.debug("Not an Image either: %s", img_error)
                         return {'error': f'Unable to access dataset as Image or ImageCollection: {img_error}'}
 
                 # Now process based on the dataset type
@@ -994,23 +1564,13 @@ class GEEService:
 
                 # Process the region
                 try:
-                    # If region is already a JSON string
-                    if isinstance(region, str):
-                        region_geom = geojson.loads(region)
-                    else:
-                        region_geom = region
-
-                    ee_geometry = ee.Geometry(
-                        region_geom['features'][0]['geometry'])
-                except Exception as e:
-                    print(f"Error processing region: {e}")
+                    ee_geometry = parse_region(region)
+                except ValueError as e:
+                    logger.debug("Error processing region: %s", e)
                     return {'error': f'Invalid region format: {str(e)}'}
 
                 # Create filename
-                if isinstance(dataset_id, str) and '/' in dataset_id:
-                    filename_base = dataset_id.split('/')[-1]
-                else:
-                    filename_base = str(dataset_id).replace('/', '_')
+                filename_base = _filename_base(str(dataset_id))
 
                 output_name = f'{filename_base}_{variable}_{start_date}_{end_date}'
 
@@ -1033,7 +1593,7 @@ class GEEService:
 
             except Exception as e:
                 error_msg = str(e)
-                print(f"Error in direct access approach: {error_msg}")
+                logger.debug("Error in direct access approach: %s", error_msg)
 
                 # If it's a permission error, return specific error
                 if "permission" in error_msg.lower():
@@ -1044,7 +1604,7 @@ class GEEService:
                     return {'error': f'Failed to process or download dataset: {error_msg}'}
 
         except Exception as e:
-            print(f"Error in get_download_url: {e}")
+            logger.warning("Error in get_download_url: %s", e)
             return {'error': str(e)}
 
     @staticmethod
@@ -1054,14 +1614,14 @@ class GEEService:
             # Ensure Earth Engine is initialized with the correct project ID
             if project_name:
                 try:
-                    ee.Initialize(project=project_name)
-                    print(
-                        f"Re-initialized Earth Engine with project ID: {project_name} for dataset access check")
+                    GEEService.ensure_initialized(project_name)
+                    logger.debug(
+                        "Earth Engine initialized with project ID: %s for dataset access check", project_name)
                 except Exception as e:
-                    print(
-                        f"Error initializing Earth Engine with project {project_name}: {e}")
+                    logger.debug(
+                        "Error initializing Earth Engine with project %s: %s", project_name, e)
                     error_msg = str(e)
-                    if "Permission denied" in error_msg or "not found" in error_msg or "does not have required permission" in error_msg:
+                    if PERMISSION_ERROR_RE.search(error_msg):
                         return {
                             'success': False,
                             'error': 'Project ID error',
@@ -1070,26 +1630,8 @@ class GEEService:
                         }
                     # Continue execution as it might already be initialized
 
-            # Try different approaches to access the dataset
-            # First attempt: Try to load as an Image
-            try:
-                image = ee.Image(dataset_id)
-                # Just attempt to get any property to verify access
-                _ = image.bandNames().getInfo()
-                return {'success': True, 'info': {'type': 'IMAGE'}}
-            except Exception as img_error:
-                print(f"Not an image or error: {img_error}")
-
-            # Second attempt: Try to load as an ImageCollection
-            try:
-                collection = ee.ImageCollection(dataset_id)
-                # Just attempt to get size to verify access
-                _ = collection.size().getInfo()
-                return {'success': True, 'info': {'type': 'IMAGE_COLLECTION'}}
-            except Exception as coll_error:
-                print(f"Not an image collection or error: {coll_error}")
-
-            # If both approaches fail, try the original method
+            # The asset metadata includes the dataset type, so a single
+            # request both verifies access and tells images from collections
             basic_info = ee.data.getInfo(dataset_id)
             if basic_info:
                 return {'success': True, 'info': basic_info}
@@ -1098,7 +1640,8 @@ class GEEService:
 
         except ee.ee_exception.EEException as e:
             error_msg = str(e)
-            print(f"Error accessing dataset {dataset_id}: {error_msg}")
+            logger.debug(
+                "Error accessing dataset %s: %s", dataset_id, error_msg)
 
             # Check if it's a permission error
             if "does not have required permission" in error_msg or "permission denied" in error_msg:
@@ -1116,9 +1659,44 @@ class GEEService:
                     'message': f'Error accessing dataset: {error_msg}'
                 }
         except Exception as e:
-            print(f"General error checking dataset access: {e}")
+            logger.warning("General error checking dataset access: %s", e)
             return {
                 'success': False,
                 'error': 'Error checking dataset access',
                 'message': str(e)
             }
+
+    @staticmethod
+    def check_dataset_access_batch(dataset_ids: List[str], project_name: str = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Check access to several datasets concurrently
+
+        Parameters:
+        -----------
+        dataset_ids : list of str
+            Earth Engine dataset IDs to check
+        project_name : str, optional
+            The Earth Engine project ID to use
+
+        Returns:
+        --------
+        Dict mapping each dataset ID to the result of check_dataset_access
+        """
+        dataset_ids = list(dict.fromkeys(dataset_ids))
+        if not dataset_ids:
+            return {}
+
+        # Initialize once up front so the workers do not race to do it
+        if project_name:
+            try:
+                GEEService.ensure_initialized(project_name)
+            except Exception as e:
+                logger.debug(
+                    "Error initializing Earth Engine with project %s: %s", project_name, e)
+
+        # The checks are independent HTTP round trips, so the wall time is
+        # roughly that of the slowest one
+        with ThreadPoolExecutor(max_workers=min(ACCESS_CHECK_POOL_SIZE, len(dataset_ids))) as executor:
+            results = executor.map(
+                GEEService.check_dataset_access, dataset_ids)
+            return dict(zip(dataset_ids, results))
@@ -1,15 +1,23 @@
 from django import template
-from datetime import datetime
+from functools import lru_cache
+import time
 
 register = template.Library()
 
 
+@lru_cache(maxsize=4096)
+def _format_timestamp(timestamp):
+    """Format a millisecond timestamp as YYYY-MM-DD in TIME_ZONE (UTC)"""
+    t = time.gmtime(timestamp / 1000)
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+
+
 @register.filter
 def timestamp_to_date(timestamp):
     """Convert a millisecond timestamp to a formatted date string"""
     if not timestamp:
         return ""
     try:
-        return datetime.fromtimestamp(timestamp / 1000).strftime('%Y-%m-%d')
-    except (ValueError, TypeError):
+        return _format_timestamp(timestamp)
+    except (ValueError, TypeError, OverflowError, OSError):
         return timestamp
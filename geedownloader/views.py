@@ -1,15 +1,59 @@
 import ee
 from django.shortcuts import render, redirect
-from django.http import JsonResponse
-import geojson
+from django.http import HttpResponse
 import datetime
-import json
+import logging
+import time
+from django.utils.cache import patch_cache_control
 from django.views.decorators.http import require_http_methods
-from .services import GEEService
-from django.core.paginator import Paginator
+from . import jsonutils
+from .jsonutils import JsonResponse
+from .services import (CREDENTIAL_ERROR_RE, PERMISSION_ERROR_RE, GEEService,
+                       temporal_info_cacheable, validate_region,
+                       variables_cacheable)
 from functools import wraps
 from django.views.decorators.csrf import ensure_csrf_cookie
-from .models import DatasetTag, DatasetMetadata
+from .models import DatasetMetadata
+
+logger = logging.getLogger(__name__)
+
+# Browser cache lifetime of successful dataset metadata responses
+METADATA_MAX_AGE = 60 * 60
+
+
+def _cache_metadata_response(response):
+    """Let the browser reuse a metadata response the service would cache
+
+    ConditionalGetMiddleware adds an ETag, so once max-age has passed the
+    browser revalidates and gets an empty 304 if nothing changed.
+    """
+    patch_cache_control(response, private=True, max_age=METADATA_MAX_AGE)
+    return response
+
+
+# Fields a request body must provide, in the order they are reported
+DOWNLOAD_REQUIRED_FIELDS = ('dataset_id', 'variable', 'start_date',
+                            'end_date', 'region', 'project_name')
+DRIVE_EXPORT_REQUIRED_FIELDS = ('start_date', 'end_date')
+
+# Maximum number of tags returned to the tag picker per keystroke
+TAG_SUGGESTION_LIMIT = 20
+
+# How long a successful Earth Engine initialization is trusted by
+# require_ee_auth and the download views before it is checked again
+EE_AUTH_CHECK_TTL = 300
+
+_ee_auth_state = {'ok': False, 'checked_at': 0.0}
+
+
+def _ee_authenticated():
+    """Return whether Earth Engine is authenticated, reusing a recent success"""
+    now = time.monotonic()
+    if not (_ee_auth_state['ok']
+            and now - _ee_auth_state['checked_at'] < EE_AUTH_CHECK_TTL):
+        _ee_auth_state['ok'] = GEEService.initialize()
+        _ee_auth_state['checked_at'] = now
+    return _ee_auth_state['ok']
 
 
 @ensure_csrf_cookie
@@ -23,11 +67,12 @@ def auth_view(request):
 def require_ee_auth(view_func):
     """Decorator to check Earth Engine authentication status
 
-    Redirects to auth page if not authenticated
+    Redirects to auth page if not authenticated. A successful check is
+    reused for EE_AUTH_CHECK_TTL seconds.
     """
     @wraps(view_func)
     def wrapper(request, *args, **kwargs):
-        if not GEEService.initialize():
+        if not _ee_authenticated():
             return redirect('auth')
         return view_func(request, *args, **kwargs)
     return wrapper
@@ -60,9 +105,9 @@ def search_datasets(request):
     per_page = int(request.GET.get('per_page', 10))
 
     try:
-        result = GEEService.search_datasets(query, tags, page, per_page)
+        body = GEEService.search_datasets_json(query, tags, page, per_page)
 
-        return JsonResponse(result)
+        return HttpResponse(body, content_type='application/json')
 
     except Exception as e:
         return JsonResponse({
@@ -73,10 +118,8 @@ def search_datasets(request):
 
 @require_http_methods(["GET"])
 def dataset_detail(request, dataset_id):
-    print("dataset_id1", dataset_id)
     """Enhanced dataset detail view"""
     dataset_info = GEEService.get_dataset_info(dataset_id)
-    print("dataset_info", dataset_info)
 
     if not dataset_info:
         return JsonResponse({'error': 'Dataset not found'}, status=404)
@@ -90,7 +133,7 @@ def dataset_detail(request, dataset_id):
 def validate_dates(request):
     """Endpoint to validate selected date range"""
     try:
-        data = json.loads(request.body)
+        data = jsonutils.loads(request.body)
         dataset_id = data.get('dataset_id')
         start_date = data.get('start_date')
         end_date = data.get('end_date')
@@ -113,17 +156,15 @@ def download_prism(request):
     """Download PRISM dataset with specified parameters"""
     if request.method == 'POST':
         try:
-            data = request.POST.dict()
+            data = request.POST
             result = GEEService.start_download_task(
-                **{
-                    'dataset_id': data.get('dataset_id', 'OREGONSTATE/PRISM/AN81d'),
-                    'start_date': data.get('start_date'),
-                    'end_date': data.get('end_date'),
-                    'variable': data.get('variable'),
-                    'region': data.get('region'),
-                    'export_format': data.get('format', 'GeoTIFF'),
-                    'scale': int(data.get('scale', 1000))
-                }
+                dataset_id=data.get('dataset_id', 'OREGONSTATE/PRISM/AN81d'),
+                start_date=data.get('start_date'),
+                end_date=data.get('end_date'),
+                variable=data.get('variable'),
+                region=data.get('region'),
+                export_format=data.get('format', 'GeoTIFF'),
+                scale=int(data.get('scale', 1000))
             )
 
             if result.get('error'):
@@ -145,89 +186,30 @@ def download_prism(request):
 @require_ee_auth
 def get_task_status(request, task_id):
     """Get the status of a download task"""
-    print(f"\n\n==== Getting status for task ID: {task_id} ====")
+    logger.debug("Getting status for task ID: %s", task_id)
 
     # Get project ID from request
     project_id = request.GET.get('project_id')
     if project_id:
-        print(f"Using project ID from request: {project_id}")
+        logger.debug("Using project ID from request: %s", project_id)
     else:
         # Try to get from session
         project_id = request.session.get('ee_project_id')
         if project_id:
-            print(f"Using project ID from session: {project_id}")
+            logger.debug("Using project ID from session: %s", project_id)
         else:
             # Default to the one we know works
             project_id = "ee-thrcle421"
-            print(f"Using default project ID: {project_id}")
-
-    # Re-initialize Earth Engine with the correct project ID
-    try:
-        ee.Initialize(project=project_id)
-        print(f"Re-initialized Earth Engine with project ID: {project_id}")
-    except Exception as e:
-        print(
-            f"Error initializing Earth Engine with project {project_id}: {e}")
-
-    # Try directly with Earth Engine API
-    try:
-        # Get raw task list from Earth Engine
-        tasks_list = ee.data.getTaskList()
-        print(f"Total tasks from EE API: {len(tasks_list)}")
-
-        # Debug for first task in list
-        if tasks_list:
-            print(f"First task type: {type(tasks_list[0])}")
-            print(f"First task: {tasks_list[0]}")
-
-        # Direct search without using service
-        matching_task = None
-        for task in tasks_list:
-            try:
-                # Try different ways to match the task ID
-                if isinstance(task, dict) and 'id' in task and task['id'] == task_id:
-                    matching_task = task
-                    break
-                elif isinstance(task, dict) and 'id' in task and str(task['id']) == str(task_id):
-                    matching_task = task
-                    break
-            except Exception as e:
-                print(f"Error comparing task: {e}")
-                continue
+            logger.debug("Using default project ID: %s", project_id)
 
-        if matching_task:
-            print(f"Found matching task directly: {matching_task}")
-            # Construct a safe response
-            try:
-                state = matching_task.get('state', 'UNKNOWN') if isinstance(
-                    matching_task, dict) else 'UNKNOWN'
-                progress = matching_task.get('progress', 0) if isinstance(
-                    matching_task, dict) else 0
-                error_msg = matching_task.get('error_message', None) if isinstance(
-                    matching_task, dict) else None
-
-                response_data = {
-                    'status': state,
-                    'progress': progress,
-                    'error': error_msg
-                }
-                print(f"Direct response data: {response_data}")
-                return JsonResponse(response_data)
-            except Exception as direct_e:
-                print(f"Error building direct response: {direct_e}")
-                # Continue to service method
-    except Exception as ee_error:
-        print(f"Direct EE API error: {ee_error}")
-        # Continue to service method
-
-    # Fallback to service method with explicit project ID
+    # The service keeps the project initialized and serves the task from
+    # one cached task list shared between pollers
     try:
         result = GEEService.get_task_status(task_id, project_name=project_id)
-        print(f"Service result: {result}")
 
         # Ensure result is a dictionary
         if not isinstance(result, dict):
-            print(f"Result is not a dict: {type(result)}")
+            logger.debug("Result is not a dict: %s", type(result))
             result = {'status': 'FAILED', 'error': 'Invalid result format'}
 
         # Ensure result has status field
@@ -236,12 +218,9 @@ def get_task_status(request, task_id):
         elif 'status' not in result:
             result['status'] = 'UNKNOWN'
 
-        print(f"Final result: {result}")
         return JsonResponse(result)
     except Exception as e:
-        import traceback
-        print(f"Error in get_task_status: {e}")
-        traceback.print_exc()
+        logger.exception("Error in get_task_status: %s", e)
         return JsonResponse({
             'status': 'FAILED',
             'error': f"Server error: {str(e)}"
@@ -257,7 +236,10 @@ def get_dataset_variables(request):
 
     try:
         variables = GEEService.get_available_variables(dataset_id)
-        return JsonResponse({'variables': variables})
+        response = JsonResponse({'variables': variables})
+        if not variables_cacheable(variables):
+            return response
+        return _cache_metadata_response(response)
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
@@ -266,7 +248,6 @@ def get_dataset_variables(request):
 def get_dataset_temporal_info(request):
     """Get temporal information for a dataset"""
     dataset_id = request.GET.get('dataset_id')
-    print("dataset_id2", dataset_id)
     if not dataset_id:
         return JsonResponse({'error': 'Missing dataset_id parameter'}, status=400)
 
@@ -278,18 +259,20 @@ def get_dataset_temporal_info(request):
         # If project ID is provided, try to initialize Earth Engine
         if project_id:
             try:
-                ee.Initialize(project=project_id)
-                print(
-                    f"Initialized Earth Engine with project: {project_id} for temporal info")
+                GEEService.ensure_initialized(project_id)
+                logger.debug(
+                    "Initialized Earth Engine with project: %s for temporal info", project_id)
             except Exception as e:
-                print(f"Error initializing Earth Engine: {e}")
+                logger.debug("Error initializing Earth Engine: %s", e)
 
         # Call Earth Engine to get temporal information
         info = GEEService.get_dataset_temporal_info(dataset_id, project_id)
-        return JsonResponse(info)
+        response = JsonResponse(info)
+        if not temporal_info_cacheable(info):
+            return response
+        return _cache_metadata_response(response)
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in get_dataset_temporal_info: %s", e)
         return JsonResponse({'error': str(e)}, status=500)
 
 
@@ -306,19 +289,17 @@ def select_project(request):
 @require_http_methods(["POST"])
 def download_dataset(request):
     """Dataset download endpoint with improved error handling and validation"""
-    if not GEEService.initialize():
+    if not _ee_authenticated():
         return JsonResponse({
             'error': 'Authentication required',
             'auth_required': True
         }, status=401)
 
     try:
-        data = json.loads(request.body)
+        data = jsonutils.loads(request.body)
 
-        required_fields = ['dataset_id', 'variable',
-                           'start_date', 'end_date', 'region', 'project_name']
         missing_fields = [
-            field for field in required_fields if not data.get(field)]
+            field for field in DOWNLOAD_REQUIRED_FIELDS if not data.get(field)]
         if missing_fields:
             return JsonResponse({
                 'error': f'Missing required fields: {", ".join(missing_fields)}'
@@ -326,51 +307,22 @@ def download_dataset(request):
 
         # Re-initialize Earth Engine with the provided project ID
         try:
-            ee.Initialize(project=data['project_name'])
-            print(
-                f"Re-initialized Earth Engine with project: {data['project_name']}")
+            GEEService.ensure_initialized(data['project_name'])
+            logger.debug(
+                "Initialized Earth Engine with project: %s", data['project_name'])
         except Exception as e:
-            print(f"Error re-initializing Earth Engine: {e}")
-
-        if not GEEService.validate_date_range(
-            data['dataset_id'],
-            data['start_date'],
-            data['end_date']
-        ):
-            return JsonResponse({
-                'error': 'Selected date range is not available for this dataset'
-            }, status=400)
-
-        # Validate variable availability
-        variables_result = GEEService.get_available_variables(
-            data['dataset_id'])
-        # Check if variables exist in the result and properly access the variables
-        if 'variables' in variables_result and isinstance(variables_result['variables'], list):
-            variables = variables_result['variables']
-            if not any(v.get('id') == data['variable'] for v in variables):
-                return JsonResponse({
-                    'error': 'Selected variable is not available for this dataset'
-                }, status=400)
-        else:
-            # If variables structure is different, skip validation to avoid errors
-            print(
-                f"Warning: Unexpected variables structure: {variables_result}")
+            logger.debug("Error re-initializing Earth Engine: %s", e)
 
-        # Validate region format
+        # Validate region format. Clients send the GeoJSON as a nested
+        # object, which arrives already parsed with the body; a string is
+        # still accepted and parsed once for the service. Only the structure
+        # is checked here, the service builds the Earth Engine geometry
         try:
             region = data['region']
-            if isinstance(region, str):
-                try:
-                    region_obj = json.loads(region)
-                    if not region_obj or not isinstance(region_obj, dict) or not region_obj.get('features'):
-                        raise ValueError(
-                            'Invalid region format: missing features or invalid structure')
-                except json.JSONDecodeError:
-                    raise ValueError(
-                        'Invalid region format: not a valid JSON string')
-            else:
-                raise ValueError('Region must be a GeoJSON string')
-        except (ValueError, AttributeError) as e:
+            if not isinstance(region, (str, dict)):
+                raise ValueError('Region must be a GeoJSON object or string')
+            validate_region(region)
+        except (ValueError, TypeError, KeyError) as e:
             return JsonResponse({
                 'error': f'Invalid region format: {str(e)}'
             }, status=400)
@@ -388,10 +340,13 @@ def download_dataset(request):
             project_name=data['project_name']  # Pass project ID
         )
 
+        # Invalid dates and variables are reported by the service with an
+        # error_code, so they need no separate checks here
         if result.get('error'):
-            return JsonResponse({
-                'error': result['error']
-            }, status=400)
+            response = {'error': result['error']}
+            if result.get('error_code'):
+                response['error_code'] = result['error_code']
+            return JsonResponse(response, status=400)
 
         return JsonResponse({
             'status': 'success',
@@ -399,13 +354,12 @@ def download_dataset(request):
             'task_id': result['task_id']
         })
 
-    except json.JSONDecodeError:
+    except jsonutils.JSONDecodeError:
         return JsonResponse({
             'error': 'Invalid JSON data'
         }, status=400)
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in download_dataset: %s", e)
         return JsonResponse({
             'error': str(e),
             'message': 'Error occurred while starting download task'
@@ -420,28 +374,25 @@ def check_auth_status(request):
 def get_tags(request):
     """Get all available tags from database"""
     search_term = request.GET.get('term', '')
-    tags = DatasetTag.objects.filter(
-        name__icontains=search_term).values('name')
-    return JsonResponse(list(tags), safe=False)
+    names = GEEService.suggest_tags(search_term, TAG_SUGGESTION_LIMIT)
+    return JsonResponse([{'name': name} for name in names], safe=False)
 
 
 @require_http_methods(["POST"])
 def download_local(request):
     """Handle local downloads by generating a direct download URL"""
-    if not GEEService.initialize():
+    if not _ee_authenticated():
         return JsonResponse({
             'error': 'Authentication required',
             'auth_required': True
         }, status=401)
 
     try:
-        data = json.loads(request.body)
+        data = jsonutils.loads(request.body)
 
         # Validate required parameters
-        required_fields = ['dataset_id', 'variable',
-                           'start_date', 'end_date', 'region', 'project_name']
         missing_fields = [
-            field for field in required_fields if not data.get(field)]
+            field for field in DOWNLOAD_REQUIRED_FIELDS if not data.get(field)]
         if missing_fields:
             return JsonResponse({
                 'error': f'Missing required fields: {", ".join(missing_fields)}'
@@ -449,28 +400,22 @@ def download_local(request):
 
         # Re-initialize Earth Engine with the provided project ID
         try:
-            ee.Initialize(project=data['project_name'])
-            print(
-                f"Re-initialized Earth Engine with project: {data['project_name']}")
+            GEEService.ensure_initialized(data['project_name'])
+            logger.debug(
+                "Initialized Earth Engine with project: %s", data['project_name'])
         except Exception as e:
-            print(f"Error re-initializing Earth Engine: {e}")
+            logger.debug("Error re-initializing Earth Engine: %s", e)
 
-        # Validate region format
+        # Validate region format. Clients send the GeoJSON as a nested
+        # object, which arrives already parsed with the body; a string is
+        # still accepted and parsed once for the service. Only the structure
+        # is checked here, the service builds the Earth Engine geometry
         try:
-            # region should be a GeoJSON string, but let's verify
             region = data['region']
-            if isinstance(region, str):
-                try:
-                    region_obj = json.loads(region)
-                    if not region_obj or not isinstance(region_obj, dict) or not region_obj.get('features'):
-                        raise ValueError(
-                            'Invalid region format: missing features or invalid structure')
-                except json.JSONDecodeError:
-                    raise ValueError(
-                        'Invalid region format: not a valid JSON string')
-            else:
-                raise ValueError('Region must be a GeoJSON string')
-        except (ValueError, AttributeError) as e:
+            if not isinstance(region, (str, dict)):
+                raise ValueError('Region must be a GeoJSON object or string')
+            validate_region(region)
+        except (ValueError, TypeError, KeyError) as e:
             return JsonResponse({
                 'error': f'Invalid region format: {str(e)}'
             }, status=400)
@@ -495,13 +440,12 @@ def download_local(request):
 
         return JsonResponse(result)
 
-    except json.JSONDecodeError:
+    except jsonutils.JSONDecodeError:
         return JsonResponse({
             'error': 'Invalid JSON data'
         }, status=400)
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in download_local: %s", e)
         return JsonResponse({
             'error': str(e),
             'message': 'Error occurred while generating download URL'
@@ -522,16 +466,19 @@ def get_dataset_api_variables(request, dataset_id):
         # If project ID is provided, try to initialize Earth Engine
         if project_id:
             try:
-                ee.Initialize(project=project_id)
-                print(f"Initialized Earth Engine with project: {project_id}")
+                GEEService.ensure_initialized(project_id)
+                logger.debug(
+                    "Initialized Earth Engine with project: %s", project_id)
             except Exception as e:
-                print(f"Error initializing Earth Engine: {e}")
+                logger.debug("Error initializing Earth Engine: %s", e)
 
         result = GEEService.get_available_variables(dataset_id, project_id)
-        return JsonResponse(result)
+        response = JsonResponse(result)
+        if not variables_cacheable(result):
+            return response
+        return _cache_metadata_response(response)
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in get_dataset_api_variables: %s", e)
         return JsonResponse({'error': str(e)}, status=500)
 
 
@@ -541,9 +488,9 @@ def reinitialize_ee(request):
     try:
         # Try to get project_id from request body
         try:
-            data = json.loads(request.body)
+            data = jsonutils.loads(request.body)
             project_id = data.get('project_id')
-        except json.JSONDecodeError:
+        except jsonutils.JSONDecodeError:
             # Try to get from form data
             project_id = request.POST.get('project_id')
 
@@ -560,26 +507,37 @@ def reinitialize_ee(request):
         # Save project_id to session
         request.session['ee_project_id'] = project_id
 
-        # Reinitialize Earth Engine
-        ee.Authenticate()
-        ee.Initialize(project=project_id)
+        # Reinitialize Earth Engine, only running the authentication flow
+        # when the stored credentials cannot be used; new credentials do
+        # not help with a wrong or inaccessible project
+        GEEService.reset_initialization()
+        try:
+            GEEService.ensure_initialized(project_id)
+        except Exception as e:
+            error_msg = str(e)
+            if CREDENTIAL_ERROR_RE.search(error_msg):
+                logger.debug("Initialization failed, authenticating: %s", e)
+                ee.Authenticate()
+                GEEService.ensure_initialized(project_id)
+            elif PERMISSION_ERROR_RE.search(error_msg):
+                logger.warning(
+                    "Project %s is not accessible: %s", project_id, error_msg)
+                return JsonResponse({
+                    'success': False,
+                    'message': f'Permission error: Caller does not have required permission to use project {project_id}. Please check your project ID.'
+                }, status=403)
+            else:
+                raise
+        _ee_auth_state['ok'] = True
+        _ee_auth_state['checked_at'] = time.monotonic()
 
-        # Test connection
-        test = ee.Number(1).add(2).getInfo()
-        if test == 3:
-            return JsonResponse({
-                'success': True,
-                'message': 'Earth Engine authentication successful',
-                'project_id': project_id
-            })
-        else:
-            return JsonResponse({
-                'success': False,
-                'message': 'Earth Engine authentication test failed'
-            }, status=400)
+        return JsonResponse({
+            'success': True,
+            'message': 'Earth Engine authentication successful',
+            'project_id': project_id
+        })
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in reinitialize_ee: %s", e)
         return JsonResponse({
             'success': False,
             'message': f'Failed to reinitialize Earth Engine: {str(e)}'
@@ -591,12 +549,11 @@ def reinitialize_ee(request):
 def ee_download_to_drive(request):
     """API endpoint for downloading Earth Engine data directly to Google Drive using the download_ee_to_drive utility"""
     try:
-        data = json.loads(request.body)
+        data = jsonutils.loads(request.body)
 
         # Required parameters
-        required_fields = ['start_date', 'end_date']
         missing_fields = [
-            field for field in required_fields if not data.get(field)]
+            field for field in DRIVE_EXPORT_REQUIRED_FIELDS if not data.get(field)]
         if missing_fields:
             return JsonResponse({
                 'error': f'Missing required fields: {", ".join(missing_fields)}'
@@ -616,7 +573,7 @@ def ee_download_to_drive(request):
             try:
                 region_geom = data.get('region')
                 if isinstance(region_geom, str):
-                    region_geom = json.loads(region_geom)
+                    region_geom = jsonutils.loads(region_geom)
 
                 if 'features' in region_geom:
                     region = ee.Geometry(
@@ -662,13 +619,12 @@ def ee_download_to_drive(request):
             'folder_name': folder_name
         })
 
-    except json.JSONDecodeError:
+    except jsonutils.JSONDecodeError:
         return JsonResponse({
             'error': 'Invalid JSON data'
         }, status=400)
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in ee_download_to_drive: %s", e)
         return JsonResponse({
             'error': str(e),
             'message': 'Error occurred while starting download tasks'